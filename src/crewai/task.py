@@ -1,14 +1,30 @@
-import threading
+import asyncio
+import os
+import traceback
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import suppress
 from typing import Any, List, Optional, Type
 
-from pydantic import UUID4, BaseModel, Field, field_validator, model_validator
+from pydantic import UUID4, BaseModel, Field, PrivateAttr, field_validator
 from pydantic_core import PydanticCustomError
 
 from crewai.agent import Agent
 from crewai.tasks.task_output import TaskOutput
 from crewai.utilities import I18N, Instructor
 
+# Shared pool for tasks with `async_execution`, threads are only spawned on demand.
+_TASK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4),
+    thread_name_prefix="crewai-task",
+)
+
+
+def _report_exception(future: Future) -> None:
+    """Print errors from async tasks, even if nobody waits on their result."""
+    if not future.cancelled() and (error := future.exception()) is not None:
+        traceback.print_exception(error)
+
 
 class Task(BaseModel):
     """Class that represent a task to be executed."""
@@ -18,8 +34,8 @@ class Task(BaseModel):
 
     __hash__ = object.__hash__  # type: ignore
     used_tools: int = 0
+    _future: Optional[Future] = PrivateAttr(default=None)
     i18n: I18N = I18N()
-    thread: threading.Thread = None
     description: str = Field(description="Description of the actual task.")
     callback: Optional[Any] = Field(
         description="Callback to be executed after the task is completed.", default=None
@@ -72,24 +88,25 @@ class Task(BaseModel):
                 "may_not_set_field", "This field is not to be set by the user.", {}
             )
 
-    @model_validator(mode="after")
-    def check_tools(self):
-        """Check if the tools are set."""
+    @property
+    def future(self) -> Optional[Future]:
+        """Future of the task's execution.
+
+        Set by `execute` for `async_execution` tasks and by `aexecute` for any task.
+        """
+        return self._future
+
+    def model_post_init(self, __context: Any) -> None:
+        """Set the tools from the agent and check only one output type is set."""
         if not self.tools and self.agent and self.agent.tools:
             self.tools.extend(self.agent.tools)
-        return self
 
-    @model_validator(mode="after")
-    def check_output(self):
-        """Check if an output type is set."""
-        output_types = [self.output_json, self.output_pydantic]
-        if len([type for type in output_types if type]) > 1:
+        if self.output_json is not None and self.output_pydantic is not None:
             raise PydanticCustomError(
                 "output_type",
                 "Only one output type can be set, either output_pydantic or output_json.",
                 {},
             )
-        return self
 
     def execute(
         self,
@@ -103,27 +120,21 @@ class Task(BaseModel):
             Output of the task.
         """
 
-        agent = agent or self.agent
-        if not agent:
-            raise Exception(
-                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
-            )
+        agent = self._get_agent(agent)
 
         if self.context:
-            context = []
-            for task in self.context:
-                if task.async_execution:
-                    task.thread.join()
-                context.append(task.output.raw_output)
-            context = "\n".join(context)
+            # Wait on all async context tasks at once, failing on the first error.
+            for future in as_completed(self._context_futures()):
+                future.result()
+            context = self._context_output()
 
         tools = tools or self.tools
 
         if self.async_execution:
-            self.thread = threading.Thread(
-                target=self._execute, args=(agent, self, context, tools)
+            self._future = _TASK_EXECUTOR.submit(
+                self._execute, agent, self, context, tools
             )
-            self.thread.start()
+            self._future.add_done_callback(_report_exception)
         else:
             result = self._execute(
                 task=self,
@@ -133,6 +144,49 @@ class Task(BaseModel):
             )
             return result
 
+    async def aexecute(
+        self,
+        agent: Agent | None = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute the task without blocking the running event loop.
+
+        Agents run synchronously, so the execution itself is submitted to the
+        shared task pool while the loop is free to drive other tasks.
+
+        Returns:
+            Output of the task.
+        """
+
+        agent = self._get_agent(agent)
+
+        if self.context:
+            await asyncio.gather(
+                *(asyncio.wrap_future(future) for future in self._context_futures())
+            )
+            context = self._context_output()
+
+        tools = tools or self.tools
+
+        self._future = _TASK_EXECUTOR.submit(self._execute, agent, self, context, tools)
+        return await asyncio.wrap_future(self._future)
+
+    def _get_agent(self, agent: Agent | None) -> Agent:
+        agent = agent or self.agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
+        return agent
+
+    def _context_futures(self) -> List[Future]:
+        # Any started task may still be running, not only `async_execution` ones.
+        return [task._future for task in self.context if task._future is not None]
+
+    def _context_output(self) -> str:
+        return "\n".join(task.output.raw_output for task in self.context)
+
     def _execute(self, agent, task, context, tools):
         result = agent.execute_task(
             task=task,
@@ -169,26 +223,38 @@ class Task(BaseModel):
         return "\n".join(tasks_slices)
 
     def _export_output(self, result: str) -> Any:
-        if self.output_pydantic or self.output_json:
-            model = self.output_pydantic or self.output_json
+        output_pydantic, output_json = self.output_pydantic, self.output_json
+        if output_pydantic is None and output_json is None and not self.output_file:
+            return result
+
+        if output_pydantic or output_json:
+            model = output_pydantic or output_json
             instructor = Instructor(
                 agent=self.agent,
                 content=result,
                 model=model,
             )
 
-            if self.output_pydantic:
+            if output_pydantic:
                 result = instructor.to_pydantic()
-            elif self.output_json:
+            elif output_json:
                 result = instructor.to_json()
 
         if self.output_file:
-            content = result if not self.output_pydantic else result.json()
+            content = result if not output_pydantic else result.json()
             self._save_file(content)
 
         return result
 
     def _save_file(self, result: Any) -> None:
-        with open(self.output_file, "w") as file:
-            file.write(result)
+        # Write to a temporary file first so readers never see a partial output.
+        tmp_file = f"{self.output_file}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_file, "wb") as file:
+                file.write(result.encode("utf-8"))
+            os.replace(tmp_file, self.output_file)
+        except Exception:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_file)
+            raise
         return None
@@ -1,5 +1,9 @@
+import queue
+import threading
+from contextlib import suppress
+from functools import cached_property
 from textwrap import dedent
-from typing import Any, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from langchain.prompts import PromptTemplate
 from langchain_core.tools import BaseTool
@@ -13,6 +17,62 @@ from crewai.utilities import I18N, Instructor, Printer
 
 OPENAI_BIGGER_MODELS = ["gpt-4"]
 
+# Translations are loaded from disk, so they're shared by every ToolUsage.
+_I18N = I18N()
+
+# Telemetry events are recorded by a background thread so tool usage never waits
+# on it, events are dropped once this many are pending.
+_TELEMETRY_QUEUE_MAXSIZE = 1000
+_TELEMETRY_QUEUE: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue(
+    maxsize=_TELEMETRY_QUEUE_MAXSIZE
+)
+
+
+def _record_telemetry(event: str, **kwargs: Any) -> None:
+    """Queue a telemetry event, dropping it if the queue is full."""
+    try:
+        _TELEMETRY_QUEUE.put_nowait((event, kwargs))
+    except queue.Full:
+        pass
+
+
+def _telemetry_worker() -> None:
+    telemetry = Telemetry()
+    while True:
+        method, kwargs = _TELEMETRY_QUEUE.get()
+        try:
+            getattr(telemetry, method)(**kwargs)
+        except Exception:
+            pass
+
+
+threading.Thread(target=_telemetry_worker, name="crewai-telemetry", daemon=True).start()
+
+_FORMAT_INSTRUCTIONS = dedent(
+    """\
+    The schema should have the following structure, only two keys:
+    - tool_name: str
+    - arguments: dict (with all arguments being passed)
+
+    Example:
+    {"tool_name": "tool_name", "arguments": {"arg_name1": "value", "arg_name2": 2}}
+    """
+)
+
+
+_INSTRUCTOR_INSTRUCTIONS = dedent(
+    """\
+    The schema should have the following structure, only two keys:
+    - tool_name: str
+    - arguments: dict (with all arguments being passed)
+
+    Example:
+    {"tool_name": "tool name", "arguments": {"arg_name1": "value", "arg_name2": 2}}
+    """
+)
+
+_PROMPT_TEMPLATE = "Tools available:\n\n{available_tools}\n\nReturn a valid schema for the tool, the tool name must be equal one of the options, use this text to inform a valid ouput schema:\n{tool_string}\n\n{format_instructions}\n```"
+
 
 class ToolUsageErrorException(Exception):
     """Exception raised for errors in the tool usage."""
@@ -46,9 +106,12 @@ class ToolUsage:
         llm: Any,
         function_calling_llm: Any,
     ) -> None:
-        self._i18n: I18N = I18N()
+        self._i18n: I18N = _I18N
+        self._fmt_final_answer: str = self._i18n.slice("final_answer_format")
+        self._fmt_tools_tmpl: str = self._i18n.slice("tools")
+        self._fmt_repeat_tmpl: str = self._i18n.errors("task_repeated_usage")
+        self._fmt_format_tmpl: str = self._i18n.slice("format")
         self._printer: Printer = Printer()
-        self._telemetry: Telemetry = Telemetry()
         self._run_attempts: int = 1
         self._max_parsing_attempts: int = 3
         self._remeber_format_after_usages: int = 3
@@ -56,6 +119,9 @@ class ToolUsage:
         self.tools_names = tools_names
         self.tools_handler = tools_handler
         self.tools = tools
+        self._tools_by_name: Dict[str, BaseTool] = {}
+        for tool in tools:
+            self._tools_by_name.setdefault(tool.name.lower().strip(), tool)
         self.task = task
         self.llm = function_calling_llm or llm
 
@@ -82,7 +148,7 @@ class ToolUsage:
             error = getattr(e, "message", str(e))
             self._printer.print(content=f"\n\n{error}\n", color="red")
             return error
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}\n\n{self._i18n.slice('final_answer_format')}"
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}\n\n{self._fmt_final_answer}"
 
     def _use(
         self,
@@ -91,51 +157,61 @@ class ToolUsage:
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> None:
         if self._check_tool_repeated_usage(calling=calling):
-            try:
-                result = self._i18n.errors("task_repeated_usage").format(
+            result = None
+            # Only building the message can fail, in which case the tool just runs.
+            with suppress(Exception):
+                result = self._fmt_repeat_tmpl.format(
                     tool=calling.tool_name,
                     tool_input=", ".join(
                         [str(arg) for arg in calling.arguments.values()]
                     ),
                 )
+            if result is not None:
                 self._printer.print(content=f"\n\n{result}\n", color="yellow")
-                self._telemetry.tool_repeated_usage(
-                    llm=self.llm, tool_name=tool.name, attempts=self._run_attempts
+                _record_telemetry(
+                    "tool_repeated_usage",
+                    llm=self.llm,
+                    tool_name=tool.name,
+                    attempts=self._run_attempts,
                 )
                 result = self._format_result(result=result)
                 return result
-            except Exception:
-                pass
 
         result = self.tools_handler.cache.read(
             tool=calling.tool_name, input=calling.arguments
         )
 
         if not result:
-            try:
-                if calling.arguments:
-                    result = tool._run(**calling.arguments)
-                else:
-                    result = tool._run()
-            except Exception as e:
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e
-                    )
-                    error = ToolUsageErrorException(
-                        f'\n{error_message}.\nMoving one then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
-                    ).message
-                    self._printer.print(content=f"\n\n{error_message}\n", color="red")
-                    return error
-                return self.use(calling=calling, tool_string=tool_string)
+            while True:
+                try:
+                    if calling.arguments:
+                        result = tool._run(**calling.arguments)
+                    else:
+                        result = tool._run()
+                    break
+                except Exception as e:
+                    self._run_attempts += 1
+                    if self._run_attempts > self._max_parsing_attempts:
+                        _record_telemetry("tool_usage_error", llm=self.llm)
+                        error_message = self._i18n.errors(
+                            "tool_usage_exception"
+                        ).format(error=e)
+                        error = ToolUsageErrorException(
+                            f"\n{error_message}.\nMoving one then. {self._fmt_format_tmpl.format(tool_names=self.tools_names)}"
+                        ).message
+                        self._printer.print(
+                            content=f"\n\n{error_message}\n", color="red"
+                        )
+                        return error
 
             self.tools_handler.on_tool_use(calling=calling, output=result)
 
         self._printer.print(content=f"\n\n{result}\n", color="yellow")
-        self._telemetry.tool_usage(
-            llm=self.llm, tool_name=tool.name, attempts=self._run_attempts
+        _record_telemetry(
+            "tool_usage",
+            llm=self.llm,
+            tool_name=tool.name,
+            attempts=self._run_attempts,
         )
         result = self._format_result(result=result)
         return result
@@ -150,25 +226,47 @@ class ToolUsage:
         return self.task.used_tools % self._remeber_format_after_usages == 0
 
     def _remember_format(self, result: str) -> None:
-        result = str(result)
-        result += "\n\n" + self._i18n.slice("tools").format(
+        tools = self._fmt_tools_tmpl.format(
             tools=self.tools_description, tool_names=self.tools_names
         )
-        return result
+        return f"{result}\n\n{tools}"
 
     def _check_tool_repeated_usage(
         self, calling: Union[ToolCalling, InstructorToolCalling]
     ) -> None:
         if last_tool_usage := self.tools_handler.last_used_tool:
-            return (calling.tool_name == last_tool_usage.tool_name) and (
-                calling.arguments == last_tool_usage.arguments
-            )
+            args, last_args = calling.arguments, last_tool_usage.arguments
+            if calling.tool_name != last_tool_usage.tool_name:
+                return False
+            # Cheap identity and size checks before a full arguments comparison.
+            if args is last_args:
+                return True
+            return len(args or {}) == len(last_args or {}) and args == last_args
 
     def _select_tool(self, tool_name: str) -> BaseTool:
-        for tool in self.tools:
-            if tool.name.lower().strip() == tool_name.lower().strip():
-                return tool
-        raise Exception(f"Tool '{tool_name}' not found.")
+        tool = self._tools_by_name.get(tool_name.lower().strip())
+        if tool is None:
+            raise Exception(f"Tool '{tool_name}' not found.")
+        return tool
+
+    @cached_property
+    def _rendered(self) -> str:
+        """Tools rendered in plain text, computed once per instance."""
+        return self._render()
+
+    @cached_property
+    def _chain(self) -> Any:
+        """Prompt, llm and parser chain used to parse tool calls."""
+        parser = ToolOutputParser(pydantic_object=ToolCalling)
+        prompt = PromptTemplate(
+            template=_PROMPT_TEMPLATE,
+            input_variables=["tool_string"],
+            partial_variables={
+                "available_tools": self._rendered,
+                "format_instructions": _FORMAT_INSTRUCTIONS,
+            },
+        )
+        return prompt | self.llm | parser
 
     def _render(self) -> str:
         """Render the tool name and description in plain text."""
@@ -192,57 +290,30 @@ class ToolUsage:
     def _tool_calling(
         self, tool_string: str
     ) -> Union[ToolCalling, InstructorToolCalling]:
-        try:
-            if (isinstance(self.llm, ChatOpenAI)) and (
-                self.llm.openai_api_base == None
-            ):
-                instructor = Instructor(
-                    llm=self.llm,
-                    model=InstructorToolCalling,
-                    content=f"Tools available:\n###\n{self._render()}\n\nReturn a valid schema for the tool, the tool name must be equal one of the options, use this text to inform a valid ouput schema:\n{tool_string}```",
-                    instructions=dedent(
-                        """\
-                                    The schema should have the following structure, only two keys:
-                                    - tool_name: str
-                                    - arguments: dict (with all arguments being passed)
-
-                                    Example:
-                                    {"tool_name": "tool name", "arguments": {"arg_name1": "value", "arg_name2": 2}}
-                                """
-                    ),
-                )
-                calling = instructor.to_pydantic()
-
-            else:
-                parser = ToolOutputParser(pydantic_object=ToolCalling)
-                prompt = PromptTemplate(
-                    template="Tools available:\n\n{available_tools}\n\nReturn a valid schema for the tool, the tool name must be equal one of the options, use this text to inform a valid ouput schema:\n{tool_string}\n\n{format_instructions}\n```",
-                    input_variables=["tool_string"],
-                    partial_variables={
-                        "available_tools": self._render(),
-                        "format_instructions": dedent(
-                            """\
-                        The schema should have the following structure, only two keys:
-                        - tool_name: str
-                        - arguments: dict (with all arguments being passed)
-
-                        Example:
-                        {"tool_name": "tool_name", "arguments": {"arg_name1": "value", "arg_name2": 2}}
-                        """
-                        ),
-                    },
-                )
-                chain = prompt | self.llm | parser
-                calling = chain.invoke({"tool_string": tool_string})
+        while True:
+            try:
+                if (isinstance(self.llm, ChatOpenAI)) and (
+                    self.llm.openai_api_base == None
+                ):
+                    instructor = Instructor(
+                        llm=self.llm,
+                        model=InstructorToolCalling,
+                        content=f"Tools available:\n###\n{self._rendered}\n\nReturn a valid schema for the tool, the tool name must be equal one of the options, use this text to inform a valid ouput schema:\n{tool_string}```",
+                        instructions=_INSTRUCTOR_INSTRUCTIONS,
+                    )
+                    calling = instructor.to_pydantic()
 
-        except Exception as e:
-            self._run_attempts += 1
-            if self._run_attempts > self._max_parsing_attempts:
-                self._telemetry.tool_usage_error(llm=self.llm)
-                self._printer.print(content=f"\n\n{e}\n", color="red")
-                return ToolUsageErrorException(
-                    f'{self._i18n.errors("tool_usage_error")}\n{self._i18n.slice("format").format(tool_names=self.tools_names)}'
-                )
-            return self._tool_calling(tool_string)
+                else:
+                    calling = self._chain.invoke({"tool_string": tool_string})
+
+            except Exception as e:
+                self._run_attempts += 1
+                if self._run_attempts > self._max_parsing_attempts:
+                    _record_telemetry("tool_usage_error", llm=self.llm)
+                    self._printer.print(content=f"\n\n{e}\n", color="red")
+                    return ToolUsageErrorException(
+                        f'{self._i18n.errors("tool_usage_error")}\n{self._fmt_format_tmpl.format(tool_names=self.tools_names)}'
+                    )
+                continue
 
-        return calling
+            return calling
@@ -379,7 +379,7 @@ def test_agents_rpm_is_never_set_if_crew_max_RPM_is_not_set():
 
 
 def test_async_task_execution():
-    import threading
+    from concurrent.futures import Future, ThreadPoolExecutor
     from unittest.mock import patch
 
     from crewai.tasks.task_output import TaskOutput
@@ -411,10 +411,15 @@ def test_async_task_execution():
 
     with patch.object(Agent, "execute_task") as execute:
         execute.return_value = "ok"
-        with patch.object(threading.Thread, "start") as start:
-            thread = threading.Thread(target=lambda: None, args=()).start()
-            start.return_value = thread
-            with patch.object(threading.Thread, "join", wraps=thread.join()) as join:
+        with patch.object(
+            ThreadPoolExecutor,
+            "submit",
+            autospec=True,
+            side_effect=ThreadPoolExecutor.submit,
+        ) as submit:
+            with patch.object(
+                Future, "result", autospec=True, side_effect=Future.result
+            ) as result:
                 list_ideas.output = TaskOutput(
                     description="A 4 paragraph article about AI.", raw_output="ok"
                 )
@@ -422,8 +427,8 @@ def test_async_task_execution():
                     description="A 4 paragraph article about AI.", raw_output="ok"
                 )
                 crew.kickoff()
-                start.assert_called()
-                join.assert_called()
+                assert submit.call_count == 2
+                result.assert_called()
 
 
 def test_set_agents_step_callback():
@@ -453,6 +458,7 @@ def test_set_agents_step_callback():
     with patch.object(Agent, "execute_task") as execute:
         execute.return_value = "ok"
         crew.kickoff()
+        list_ideas.future.result()
         assert researcher_agent.step_callback is not None
 
 
@@ -490,6 +496,7 @@ def test_dont_set_agents_step_callback_if_already_set():
     with patch.object(Agent, "execute_task") as execute:
         execute.return_value = "ok"
         crew.kickoff()
+        list_ideas.future.result()
         assert researcher_agent.step_callback is not crew_callback
         assert researcher_agent.step_callback is agent_callback
 
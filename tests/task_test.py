@@ -1,5 +1,6 @@
 """Test Agent creation and execution basic functionality."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -138,9 +139,168 @@ def test_async_execution():
 
     with patch.object(Agent, "execute_task", return_value="ok") as execute:
         task.execute(agent=researcher)
+        task.future.result()
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_async_execution_error_is_raised_on_context_task():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        context=[list_ideas],
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=ValueError("boom")):
+        list_ideas.execute()
+        with pytest.raises(ValueError, match="boom"):
+            write_article.execute()
+
+
+def test_async_execution_error_is_reported_without_consumer():
+    import threading
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    error = ValueError("boom")
+    reported = threading.Event()
+
+    with patch.object(Agent, "execute_task", side_effect=error), patch(
+        "crewai.task.traceback.print_exception",
+        side_effect=lambda _: reported.set(),
+    ) as print_exception:
+        task.execute()
+        assert reported.wait(timeout=5)
+        print_exception.assert_called_once_with(error)
+
+
+def test_aexecute():
+    import asyncio
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        context=[list_ideas],
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", return_value="ok") as execute:
+        list_ideas.execute()
+        result = asyncio.run(write_article.aexecute())
+        assert result == "ok"
+        execute.assert_called_with(task=write_article, context="ok", tools=[])
+
+
+def test_aexecute_with_async_context_task():
+    import asyncio
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        context=[list_ideas],
+        agent=researcher,
+    )
+
+    async def run():
+        await list_ideas.aexecute()
+        return await write_article.aexecute()
+
+    with patch.object(Agent, "execute_task", return_value="ok") as execute:
+        assert asyncio.run(run()) == "ok"
+        assert list_ideas.future.done()
+        execute.assert_called_with(task=write_article, context="ok", tools=[])
+
+
+def test_aexecute_gathered_with_sync_context_task():
+    import asyncio
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        agent=researcher,
+    )
+
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        context=[list_ideas],
+        agent=researcher,
+    )
+
+    def execute_task(task, context, tools):
+        if task is list_ideas:
+            time.sleep(0.1)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(list_ideas.aexecute(), write_article.aexecute())
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task) as execute:
+        assert asyncio.run(run()) == ["ok", "ok"]
+        execute.assert_called_with(task=write_article, context="ok", tools=[])
+
+
 def test_multiple_output_type_error():
     class Output(BaseModel):
         field: str
@@ -342,3 +502,49 @@ def test_save_task_pydantic_output():
         save_file.return_value = None
         crew.kickoff()
         save_file.assert_called_once_with('{"score":4}')
+
+
+def test_save_file_writes_output_atomically(tmp_path):
+    output_file = tmp_path / "score.json"
+
+    task = Task(
+        description="Give me an integer score between 1-5 for the following title: 'The impact of AI in the future of work'",
+        expected_output="The score of the title.",
+        output_file=str(output_file),
+    )
+
+    task._save_file('{"score": 4, "note": "très bien"}')
+
+    assert (
+        output_file.read_text(encoding="utf-8") == '{"score": 4, "note": "très bien"}'
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["score.json"]
+
+
+def test_save_file_removes_temporary_file_on_failure(tmp_path):
+    task = Task(
+        description="Give me an integer score between 1-5 for the following title: 'The impact of AI in the future of work'",
+        expected_output="The score of the title.",
+        output_file=str(tmp_path / "score.json"),
+    )
+
+    with pytest.raises(AttributeError):
+        task._save_file({"score": 4})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_file_raises_original_error_when_open_fails(tmp_path):
+    output_file = tmp_path / "missing_dir" / "score.json"
+
+    task = Task(
+        description="Give me an integer score between 1-5 for the following title: 'The impact of AI in the future of work'",
+        expected_output="The score of the title.",
+        output_file=str(output_file),
+    )
+
+    with pytest.raises(FileNotFoundError) as error:
+        task._save_file('{"score": 4}')
+
+    assert error.value.__context__ is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,88 @@
+"""Test ToolUsage tool execution and retry behavior."""
+
+from unittest.mock import MagicMock
+
+from langchain.tools import tool
+
+from crewai.agents.cache import CacheHandler
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.task import Task
+from crewai.tools.tool_calling import ToolCalling
+from crewai.tools.tool_usage import ToolUsage
+from crewai.utilities import I18N
+
+i18n = I18N()
+
+
+def _tool_usage(tools, tools_handler=None):
+    return ToolUsage(
+        tools_handler=tools_handler or ToolsHandler(cache=CacheHandler()),
+        tools=tools,
+        tools_description="",
+        tools_names=", ".join(t.name for t in tools),
+        task=Task(description="Use the tool."),
+        llm=None,
+        function_calling_llm=None,
+    )
+
+
+def test_tool_run_is_retried_until_it_succeeds():
+    calls = []
+
+    @tool
+    def flaky_tool(anything: str) -> str:
+        """Fails the first time it's called."""
+        calls.append(anything)
+        if len(calls) == 1:
+            raise ValueError("Temporary failure.")
+        return "tool result"
+
+    tool_usage = _tool_usage([flaky_tool])
+    calling = ToolCalling(tool_name="flaky_tool", arguments={"anything": "x"})
+
+    result = tool_usage.use(calling, "Action: flaky_tool")
+
+    assert result.startswith("tool result")
+    assert len(calls) == 2
+    assert tool_usage._run_attempts == 2
+    assert result.count(i18n.slice("final_answer_format")) == 1
+
+
+def test_tool_run_returns_error_after_max_attempts():
+    @tool
+    def broken_tool(anything: str) -> str:
+        """Always fails."""
+        raise ValueError("Permanent failure.")
+
+    tool_usage = _tool_usage([broken_tool])
+    calling = ToolCalling(tool_name="broken_tool", arguments={"anything": "x"})
+
+    result = tool_usage.use(calling, "Action: broken_tool")
+
+    error = i18n.errors("tool_usage_exception").format(error="Permanent failure.")
+    assert error in result
+    assert tool_usage._run_attempts == tool_usage._max_parsing_attempts + 1
+
+
+def test_repeated_usage_message_failure_still_runs_the_tool():
+    calls = []
+
+    @tool
+    def repeated_tool(anything: str) -> str:
+        """Records its calls."""
+        calls.append(anything)
+        return "tool result"
+
+    calling = ToolCalling(tool_name="repeated_tool", arguments={"anything": "x"})
+    tools_handler = ToolsHandler(cache=CacheHandler())
+    tools_handler.last_used_tool = calling
+
+    tool_usage = _tool_usage([repeated_tool], tools_handler=tools_handler)
+    tool_usage._fmt_repeat_tmpl = MagicMock()
+    tool_usage._fmt_repeat_tmpl.format.side_effect = KeyError("tool_input")
+
+    result = tool_usage.use(calling, "Action: repeated_tool")
+
+    tool_usage._fmt_repeat_tmpl.format.assert_called_once()
+    assert calls == ["x"]
+    assert result.startswith("tool result")